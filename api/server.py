@@ -1,25 +1,114 @@
+import asyncio
+import logging
 import os
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import JSONResponse
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
+import httpx
+from fastapi import Depends, FastAPI, HTTPException, Request
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import Optional
-from dotenv import load_dotenv
 
 from services.serper_client import SerperClient
 from scraping.recipe_scraper import RecipeScraper
 from services.nutrition_client import NutritionClient
 from models.recipe_models import RecipeNutritionReport
+from utils.settings import get_settings
+from utils.cache import RedisCache
+from utils.http_client import HTTPClient
+
+
+class DeferredFormatQueueHandler(QueueHandler):
+    """QueueHandler that leaves formatting to the QueueListener thread."""
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Enqueue the record as-is.
+        
+        The stock prepare() formats the message and traceback in the
+        logging thread (here, the event loop). The queue is in-process and
+        nothing is pickled, so the listener's handler can format instead.
+        
+        Args:
+            record: Log record to enqueue
+            
+        Returns:
+            The unmodified record
+        """
+        return record
+
+
+def configure_logging() -> QueueListener:
+    """
+    Route root log records through a queue so formatting and stderr writes
+    happen on a background thread instead of the event loop.
+    
+    Returns:
+        Started QueueListener (stop it on shutdown to flush pending records)
+    """
+    log_queue = queue.Queue(-1)
+    
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    
+    root = logging.getLogger()
+    root.handlers = [DeferredFormatQueueHandler(log_queue)]
+    root.setLevel(logging.INFO)
+    
+    listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open shared clients on startup and close them on shutdown."""
+    log_listener = configure_logging()
+    # Validate settings up front so missing keys fail startup, not a request
+    settings = get_settings()
+    # Bounded pool behind asyncio.to_thread (HTML parsing in RecipeScraper)
+    app.state.parse_pool = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4))
+    asyncio.get_running_loop().set_default_executor(app.state.parse_pool)
+    # One HTTP/2 pool for Serper, API Ninjas and recipe sites
+    app.state.http = HTTPClient.create_async_client()
+    # Built once per worker and shared by every request
+    app.state.serper = SerperClient(api_key=settings.serper_api_key, http=app.state.http)
+    app.state.nutrition = NutritionClient(api_key=settings.ninja_api_key, http=app.state.http)
+    RedisCache.configure(settings.redis_url)
+    yield
+    await app.state.http.aclose()
+    await HTTPClient.close_async_client()
+    await RedisCache.close()
+    app.state.parse_pool.shutdown(wait=False)
+    log_listener.stop()
 
-# Load environment variables
-load_dotenv()
 
 app = FastAPI(
     title="Recipe & Nutrition Helper",
     description="Search recipes, scrape data, and analyze nutrition",
     version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 
+def get_http(request: Request) -> httpx.AsyncClient:
+    """Dependency returning the shared async HTTP client."""
+    return request.app.state.http
+
+
+def get_serper(request: Request) -> SerperClient:
+    """Dependency returning the shared SerperClient."""
+    return request.app.state.serper
+
+
+def get_nutrition_client(request: Request) -> NutritionClient:
+    """Dependency returning the shared NutritionClient."""
+    return request.app.state.nutrition
+
+
 class AnalyzeRequest(BaseModel):
     """Request body for POST /analyze endpoint."""
     ingredient: str
@@ -34,10 +123,13 @@ def health_check():
 
 
 @app.get("/analyze-simple")
-def analyze_simple(
+async def analyze_simple(
     ingredient: str,
     preference: Optional[str] = None,
     top_n: int = 4,
+    serper: SerperClient = Depends(get_serper),
+    nutrition_client: NutritionClient = Depends(get_nutrition_client),
+    http: httpx.AsyncClient = Depends(get_http),
 ):
     """
     Simple GET endpoint for recipe + nutrition analysis.
@@ -50,11 +142,16 @@ def analyze_simple(
     Returns:
         Recipe + nutrition report
     """
-    return analyze_recipe(ingredient, preference, top_n)
+    return await analyze_recipe(ingredient, preference, top_n, serper, nutrition_client, http)
 
 
 @app.post("/analyze")
-def analyze_recipe_endpoint(request: AnalyzeRequest):
+async def analyze_recipe_endpoint(
+    request: AnalyzeRequest,
+    serper: SerperClient = Depends(get_serper),
+    nutrition_client: NutritionClient = Depends(get_nutrition_client),
+    http: httpx.AsyncClient = Depends(get_http),
+):
     """
     POST endpoint for recipe + nutrition analysis.
     
@@ -64,10 +161,19 @@ def analyze_recipe_endpoint(request: AnalyzeRequest):
     Returns:
         Recipe + nutrition report
     """
-    return analyze_recipe(request.ingredient, request.preference, request.max_results)
+    return await analyze_recipe(
+        request.ingredient, request.preference, request.max_results, serper, nutrition_client, http
+    )
 
 
-def analyze_recipe(ingredient: str, preference: Optional[str] = None, max_results: int = 4):
+async def analyze_recipe(
+    ingredient: str,
+    preference: Optional[str],
+    max_results: int,
+    serper: SerperClient,
+    nutrition_client: NutritionClient,
+    http: httpx.AsyncClient,
+):
     """
     Core analysis pipeline: Search → Scrape → Nutrition.
     
@@ -75,9 +181,12 @@ def analyze_recipe(ingredient: str, preference: Optional[str] = None, max_result
         ingredient: Ingredient/dish to search
         preference: Optional preference filter
         max_results: Number of URLs to try scraping
+        serper: Shared SerperClient
+        nutrition_client: Shared NutritionClient
+        http: Shared async HTTP client used for scraping
     
     Returns:
-        RecipeNutritionReport as dict
+        RecipeNutritionReport serialized directly by orjson
     """
     try:
         # Build search query
@@ -86,21 +195,19 @@ def analyze_recipe(ingredient: str, preference: Optional[str] = None, max_result
             search_query += f" {preference}"
         
         # Step 1: Serper search
-        serper = SerperClient()
-        urls = serper.get_top_urls(search_query, count=max_results)
+        urls = await serper.get_top_urls(search_query, count=max_results)
         
         if not urls:
             raise HTTPException(status_code=404, detail=f"No recipes found for '{search_query}'")
         
         # Step 2: Scrape first valid recipe
-        recipe = RecipeScraper.scrape_first_valid_recipe(urls)
+        recipe = await RecipeScraper.scrape_first_valid_recipe(urls, http)
         
         if not recipe:
             raise HTTPException(status_code=404, detail=f"Could not extract recipe from search results")
         
         # Step 3: Analyze nutrition
-        nutrition_client = NutritionClient()
-        nutrition = nutrition_client.analyze_ingredients(recipe.ingredients)
+        nutrition = await nutrition_client.analyze_ingredients(recipe.ingredients)
         
         # Build report
         report = RecipeNutritionReport(
@@ -110,7 +217,9 @@ def analyze_recipe(ingredient: str, preference: Optional[str] = None, max_result
             preference=preference,
         )
         
-        return report.to_dict()
+        # orjson serializes the dataclasses natively; returning a Response
+        # also skips FastAPI's jsonable_encoder pass
+        return ORJSONResponse(report)
     
     except HTTPException:
         raise
@@ -124,6 +233,30 @@ def docs():
     return {"message": "Visit /docs for Swagger UI or /redoc for ReDoc"}
 
 
+def default_worker_count() -> int:
+    """
+    Number of Gunicorn workers for this I/O-bound service.
+    
+    Uses the (2 x CPU cores) + 1 heuristic: while one worker waits on
+    the network another can use the core.
+    
+    Returns:
+        Worker count
+    """
+    return 2 * (os.cpu_count() or 1) + 1
+
+
 if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    workers = os.getenv("WEB_CONCURRENCY") or str(default_worker_count())
+    os.execvp(
+        "gunicorn",
+        [
+            "gunicorn",
+            "-k", "api.worker.UvloopWorker",
+            "-w", workers,
+            "--bind", "0.0.0.0:8000",
+            "--access-logfile", "-",
+            "--worker-tmp-dir", "/dev/shm",
+            "api.server:app",
+        ],
+    )
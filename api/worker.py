@@ -0,0 +1,7 @@
+from uvicorn.workers import UvicornWorker
+
+
+class UvloopWorker(UvicornWorker):
+    """Gunicorn worker running Uvicorn with the uvloop event loop and httptools parser."""
+    
+    CONFIG_KWARGS = {"loop": "uvloop", "http": "httptools"}
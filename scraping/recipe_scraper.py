@@ -1,51 +1,115 @@
-import json
-from typing import Optional, List
-from bs4 import BeautifulSoup
+import asyncio
+import logging
+import re
+import httpx
+import orjson
+from typing import Any, Optional, List
 from utils.http_client import HTTPClient
 from models.recipe_models import Recipe, Ingredient, RecipeStep
 
+log = logging.getLogger(__name__)
+
+# Matches each JSON-LD script block in raw HTML bytes; group 1 is the payload
+_LDJSON_RE = re.compile(rb'<script[^>]*application/ld\+json[^>]*>(.*?)</script>', re.S | re.I)
+
+# <meta charset="..."> or <meta http-equiv=... content="text/html; charset=...">
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset=["\']?([\w.:-]+)', re.I)
+
+
+def _decode_json_block(block: bytes, encoding: Optional[str], html: bytes) -> Any:
+    """
+    Decode a JSON-LD block, falling back to the page charset for non-UTF-8 pages.
+    
+    Args:
+        block: Raw JSON-LD payload
+        encoding: Charset from the Content-Type header, if any
+        html: Raw HTML, sniffed for <meta charset> when no header charset is given
+            (windows-1252 is assumed if neither declares one)
+        
+    Returns:
+        Decoded JSON value
+        
+    Raises:
+        orjson.JSONDecodeError if the block is not valid JSON in any charset
+    """
+    try:
+        return orjson.loads(block)
+    except orjson.JSONDecodeError:
+        if not encoding:
+            match = _META_CHARSET_RE.search(html)
+            # Undeclared and not UTF-8: assume the common legacy web charset
+            encoding = match.group(1).decode("ascii") if match else "windows-1252"
+        if encoding.lower().replace("_", "-") in ("utf-8", "utf8"):
+            raise
+        try:
+            text = block.decode(encoding, "replace")
+        except LookupError:  # Unknown charset name
+            raise orjson.JSONDecodeError("unknown charset", "", 0)
+        return orjson.loads(text)
+
 
 class RecipeScraper:
     """Scrapes recipe data from URLs using JSON-LD extraction."""
     
     @staticmethod
-    def scrape_recipe(url: str) -> Optional[Recipe]:
+    async def scrape_recipe(url: str, client: Optional[httpx.AsyncClient] = None) -> Optional[Recipe]:
         """
         Scrape recipe from a URL by extracting JSON-LD structured data.
         
         Args:
             url: Target URL to scrape
+            client: Shared async HTTP client (defaults to HTTPClient's fallback client)
             
         Returns:
             Recipe object if found, None otherwise
         """
         try:
-            html = HTTPClient.fetch_html(url)
-            soup = BeautifulSoup(html, "html.parser")
+            html, encoding = await HTTPClient.afetch_html(url, client=client)
+            
+            # Parsing is a CPU burst; run it on a worker thread so the
+            # event loop keeps serving other requests
+            return await asyncio.to_thread(RecipeScraper._extract_recipe, html, url, encoding)
+        except Exception:
+            log.warning("scrape failed: %s", url, exc_info=True)
+            return None
+    
+    @staticmethod
+    def _extract_recipe(html: bytes, url: str, encoding: Optional[str] = None) -> Optional[Recipe]:
+        """
+        Find the first JSON-LD Recipe in raw HTML and parse it.
+        
+        Args:
+            html: Raw HTML bytes
+            url: Source URL
+            encoding: Response charset, used when a block is not valid UTF-8
             
-            # Find all JSON-LD script tags
-            script_tags = soup.find_all("script", {"type": "application/ld+json"})
+        Returns:
+            Recipe object if found, None otherwise
+        """
+        # Scan raw HTML for JSON-LD script blocks
+        for match in _LDJSON_RE.finditer(html):
+            block = match.group(1)
             
-            for script in script_tags:
-                try:
-                    data = json.loads(script.string)
-                    
-                    # Check if this is a Recipe type
-                    if isinstance(data, dict) and data.get("@type") == "Recipe":
-                        return RecipeScraper._parse_recipe_json(data, url)
-                    
-                    # Handle @graph case where Recipe might be nested
-                    if isinstance(data, dict) and "@graph" in data:
-                        for item in data["@graph"]:
-                            if isinstance(item, dict) and item.get("@type") == "Recipe":
-                                return RecipeScraper._parse_recipe_json(item, url)
-                except (json.JSONDecodeError, TypeError):
-                    continue
+            # Skip non-recipe blocks without decoding them
+            if b"Recipe" not in block:
+                continue
             
-            return None
-        except Exception as e:
-            print(f"Error scraping {url}: {e}")
-            return None
+            try:
+                data = _decode_json_block(block, encoding, html)
+                
+                # Check if this is a Recipe type
+                if isinstance(data, dict) and data.get("@type") == "Recipe":
+                    return RecipeScraper._parse_recipe_json(data, url)
+                
+                # Handle @graph case where Recipe might be nested
+                if isinstance(data, dict) and "@graph" in data:
+                    for item in data["@graph"]:
+                        if isinstance(item, dict) and item.get("@type") == "Recipe":
+                            return RecipeScraper._parse_recipe_json(item, url)
+            except (orjson.JSONDecodeError, TypeError):
+                continue
+        
+        return None
     
     @staticmethod
     def _parse_recipe_json(data: dict, url: str) -> Recipe:
@@ -120,19 +184,30 @@ class RecipeScraper:
         )
     
     @staticmethod
-    def scrape_first_valid_recipe(urls: List[str]) -> Optional[Recipe]:
+    async def scrape_first_valid_recipe(urls: List[str], client: Optional[httpx.AsyncClient] = None) -> Optional[Recipe]:
         """
         Scrape the first valid recipe from a list of URLs.
         
+        All URLs are fetched concurrently; the result respects the original
+        ranking order, and pending fetches are cancelled once a recipe is found.
+        
         Args:
             urls: List of URLs to try (max 4)
+            client: Shared async HTTP client, so the fetches reuse one connection pool
             
         Returns:
             First valid Recipe found, or None if none found
         """
-        for url in urls[:4]:  # Try max 4 URLs
-            recipe = RecipeScraper.scrape_recipe(url)
-            if recipe:
-                return recipe
+        tasks = [asyncio.create_task(RecipeScraper.scrape_recipe(url, client)) for url in urls[:4]]  # Try max 4 URLs
+        
+        try:
+            for task in tasks:
+                recipe = await task
+                if recipe:
+                    return recipe
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
         
         return None
@@ -1,16 +1,51 @@
-import os
-from typing import List
-from utils.http_client import HTTPClient
+import asyncio
+import logging
+import operator
+import re
+import httpx
+from collections import Counter
+from dataclasses import asdict, replace
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+from cachetools import LRUCache
+from utils.cache import RedisCache
+from utils.http_client import HTTPClient, HTTPError
+from utils.settings import get_settings
 from models.recipe_models import NutritionData, Ingredient
 
 
+log = logging.getLogger(__name__)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Per-process fast path in front of Redis, keyed by normalized query
+_local_cache: LRUCache = LRUCache(maxsize=4096)
+
+
+@lru_cache(maxsize=4096)
+def normalize_query(query: str) -> str:
+    """
+    Normalize an ingredient query for cache lookups.
+    
+    Quantities are kept: API Ninjas scales results by them, so
+    "1 tsp sugar" and "2 cups sugar" must stay distinct.
+    
+    Args:
+        query: Raw ingredient text
+        
+    Returns:
+        Lowercased query with collapsed whitespace
+    """
+    return _WHITESPACE_RE.sub(" ", query.lower()).strip()
+
+
 class NutritionClient:
     """Client for API Ninjas Nutrition API (free fields only)."""
     
     BASE_URL = "https://api.api-ninjas.com/v1/nutrition"
     
     # Free fields returned by API Ninjas
-    FREE_FIELDS = [
+    FREE_FIELDS = (
         "serving_size_g",
         "fat_total_g",
         "fat_saturated_g",
@@ -20,79 +55,320 @@ class NutritionClient:
         "sodium_mg",
         "potassium_mg",
         "cholesterol_mg",
-    ]
+    )
+    
+    # Fetches all free fields of a NutritionData as a tuple in one C call
+    # (attrgetter is not a descriptor, so self._get_free_fields(x) works)
+    _get_free_fields = operator.attrgetter(*FREE_FIELDS)
+    
+    # Max concurrent lookups against API Ninjas
+    MAX_CONCURRENCY = 10
+    
+    # Ingredients combined into one API Ninjas query, and the query length cap
+    MAX_BATCH_SIZE = 10
+    MAX_QUERY_LENGTH = 1500
+    BATCH_SEPARATOR = " and "
+    
+    # Redis cache entry lifetime (seconds)
+    CACHE_TTL = 86400
     
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, http: Optional[httpx.AsyncClient] = None):
         """
         Initialize Nutrition client.
         
         Args:
-            api_key: API Ninjas API key. If None, reads from NINJA_API_KEY env var.
+            api_key: API Ninjas API key. If None, taken from Settings (NINJA_API_KEY).
+            http: Shared async HTTP client (defaults to HTTPClient's fallback client)
         """
-        self.api_key = api_key or os.getenv("NINJA_API_KEY")
-        if not self.api_key:
-            raise ValueError("NINJA_API_KEY not found in environment or arguments")
+        self.api_key = api_key or get_settings().ninja_api_key
+        
+        # Built once and reused for every lookup
+        self.headers = {"X-Api-Key": self.api_key}
+        self.http = http
     
-    def get_nutrition(self, query: str) -> NutritionData:
+    async def get_nutrition(self, query: str) -> NutritionData:
         """
         Get nutrition data for an ingredient/food query.
         
+        Results are cached per normalized query, in-process and in Redis
+        (when REDIS_URL is set). Failed lookups are not cached.
+        
         Args:
             query: Food/ingredient name to analyze
             
         Returns:
             NutritionData object with aggregated free fields
         """
-        headers = {
-            "X-Api-Key": self.api_key,
-        }
+        normalized = normalize_query(query)
         
-        params = {"query": query}
+        cached = await self._get_cached(normalized)
+        if cached is not None:
+            return cached
         
-        try:
-            # Build URL with query param
-            url = f"{self.BASE_URL}?query={query}"
-            response = HTTPClient.get(url, headers=headers)
+        return replace(await self._fetch_uncached(normalized))
+    
+    async def _get_cached(self, normalized: str) -> Optional[NutritionData]:
+        """
+        Look up a normalized query in the local cache, then in Redis.
+        
+        Args:
+            normalized: Query already passed through normalize_query
             
-            # Sum all free fields from all results
-            aggregated = NutritionData()
+        Returns:
+            A copy of the cached NutritionData, or None on miss
+        """
+        cached = _local_cache.get(normalized)
+        if cached is not None:
+            return replace(cached)
+        
+        cached_fields = await RedisCache.get_json(f"nutri:v1:{normalized}")
+        if cached_fields is not None:
+            nutrition = NutritionData(**cached_fields)
+            _local_cache[normalized] = nutrition
+            return replace(nutrition)
+        
+        return None
+    
+    async def _store(self, normalized: str, nutrition: NutritionData) -> None:
+        """
+        Cache a successful lookup locally and in Redis.
+        
+        Args:
+            normalized: Query already passed through normalize_query
+            nutrition: Result to cache
+        """
+        _local_cache[normalized] = nutrition
+        await RedisCache.set_json(f"nutri:v1:{normalized}", asdict(nutrition), self.CACHE_TTL)
+    
+    async def _fetch_items(self, query: str) -> List[Dict[str, Any]]:
+        """
+        Call API Ninjas and return the parsed food items.
+        
+        Args:
+            query: Food/ingredient query (one item or several "and"-separated)
             
-            if isinstance(response, list):
-                items = response
-            else:
-                items = [response] if response else []
+        Returns:
+            List of item dicts as returned by the API
             
-            for item in items:
-                if isinstance(item, dict):
-                    for field in self.FREE_FIELDS:
-                        value = item.get(field, 0)
-                        if value and isinstance(value, (int, float)):
-                            setattr(aggregated, field, getattr(aggregated, field) + float(value))
+        Raises:
+            HTTPError if the request fails
+        """
+        # Let the client URL-encode the query ("&", "#", spaces in ingredient text)
+        response = await HTTPClient.aget(self.BASE_URL, headers=self.headers, params={"query": query}, client=self.http)
+        
+        if isinstance(response, list):
+            return [item for item in response if isinstance(item, dict)]
+        return [response] if isinstance(response, dict) and response else []
+    
+    def _sum_items(self, items: List[Dict[str, Any]]) -> NutritionData:
+        """
+        Sum the free fields over API Ninjas items.
+        
+        Args:
+            items: Item dicts from _fetch_items
             
-            return aggregated
-        except Exception as e:
-            print(f"Nutrition lookup failed for '{query}': {e}")
+        Returns:
+            NutritionData object with aggregated free fields
+        """
+        totals = [0.0] * len(self.FREE_FIELDS)
+        
+        for item in items:
+            for index, field in enumerate(self.FREE_FIELDS):
+                value = item.get(field)
+                if value and isinstance(value, (int, float)):
+                    totals[index] += value
+        
+        return NutritionData(**dict(zip(self.FREE_FIELDS, totals)))
+    
+    @staticmethod
+    def _match_items(names: List[str], items: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+        """
+        Map batch response items back to the ingredients that produced them.
+        
+        API Ninjas returns one item per food it recognizes, in query order,
+        but may split or drop ingredients. The mapping is only trusted when
+        there is exactly one item per ingredient and each item's name
+        appears in its ingredient's text.
+        
+        Args:
+            names: Normalized ingredient names, in query order
+            items: Items returned for the combined query
+            
+        Returns:
+            Items aligned with names, or None if they cannot be matched
+        """
+        if len(names) != len(items):
+            return None
+        
+        for name, item in zip(names, items):
+            item_name = item.get("name")
+            if not isinstance(item_name, str) or item_name.lower() not in name:
+                return None
+        
+        return items
+    
+    def build_batches(self, names: List[str]) -> List[List[str]]:
+        """
+        Group ingredient names into as few API Ninjas queries as possible.
+        
+        API Ninjas parses multiple "and"-separated items in one query, so
+        names are grouped up to MAX_BATCH_SIZE per batch, keeping each
+        joined query under MAX_QUERY_LENGTH characters.
+        
+        Args:
+            names: Normalized ingredient names
+            
+        Returns:
+            List of batches (lists of names)
+        """
+        separator_length = len(self.BATCH_SEPARATOR)
+        batches = []
+        current = []
+        length = 0
+        
+        for name in names:
+            name = name[: self.MAX_QUERY_LENGTH]
+            if not name:
+                continue
+            
+            added = len(name) + (separator_length if current else 0)
+            if current and (len(current) >= self.MAX_BATCH_SIZE or length + added > self.MAX_QUERY_LENGTH):
+                batches.append(current)
+                current = []
+                length = 0
+                added = len(name)
+            
+            current.append(name)
+            length += added
+        
+        if current:
+            batches.append(current)
+        
+        return batches
+    
+    def _is_truncated(self, name: str) -> bool:
+        """Whether build_batches may have cut this name (its cache key would never be looked up)."""
+        return len(name) >= self.MAX_QUERY_LENGTH
+    
+    async def _fetch_uncached(self, name: str) -> NutritionData:
+        """
+        Fetch one ingredient known to be a cache miss and cache the result.
+        
+        Args:
+            name: Normalized ingredient name
+            
+        Returns:
+            NutritionData (empty if the lookup fails)
+        """
+        try:
+            nutrition = self._sum_items(await self._fetch_items(name))
+        except Exception:
+            log.warning("nutrition lookup failed: %r", name, exc_info=True)
             return NutritionData()
+        
+        if not self._is_truncated(name):
+            await self._store(name, nutrition)
+        return nutrition
     
-    def analyze_ingredients(self, ingredients: List[Ingredient]) -> NutritionData:
+    async def _lookup_batch(self, names: List[str], sem: asyncio.Semaphore) -> NutritionData:
+        """
+        Look up several uncached ingredients with one combined query.
+        
+        Each ingredient's share is cached when the response can be matched
+        back to it (see _match_items); otherwise only the batch total is
+        used and the ingredients stay uncached. If the combined query
+        fails, every ingredient is looked up on its own instead, so one
+        error cannot zero the whole batch. Each of those lookups takes its
+        own semaphore slot, and the fan-out is skipped entirely when the
+        batch was rate-limited (429).
+        
+        Args:
+            names: Normalized ingredient names
+            sem: Semaphore bounding concurrent API Ninjas requests
+            
+        Returns:
+            Summed NutritionData for the batch
+        """
+        async def lookup_one(name: str) -> NutritionData:
+            # These names already missed the cache in analyze_ingredients
+            async with sem:
+                return await self._fetch_uncached(name)
+        
+        if len(names) == 1:
+            return await lookup_one(names[0])
+        
+        query = self.BATCH_SEPARATOR.join(names)
+        try:
+            async with sem:
+                items = await self._fetch_items(query)
+        except Exception as e:
+            if isinstance(e, HTTPError) and e.status_code == 429:
+                # Fanning out now would only add load while rate-limited
+                log.warning("batch nutrition lookup rate-limited, skipping: %r", query, exc_info=True)
+                return NutritionData()
+            log.warning("batch nutrition lookup failed, retrying per item: %r", query, exc_info=True)
+            results = await asyncio.gather(*(lookup_one(name) for name in names))
+            totals = [sum(values) for values in zip(*map(self._get_free_fields, results))]
+            return NutritionData(**dict(zip(self.FREE_FIELDS, totals)))
+        
+        matched = self._match_items(names, items)
+        if matched is not None:
+            for name, item in zip(names, matched):
+                if not self._is_truncated(name):
+                    await self._store(name, self._sum_items([item]))
+        
+        return self._sum_items(items)
+    
+    async def analyze_ingredients(self, ingredients: List[Ingredient]) -> NutritionData:
         """
         Analyze all ingredients and aggregate nutrition data.
         
+        Duplicate ingredients (same normalized text) are looked up once
+        and weighted by their count. Each ingredient is first looked up in
+        the cache; only the misses are batched into combined queries (see
+        build_batches), and the batches are looked up concurrently.
+        
         Args:
             ingredients: List of Ingredient objects
             
         Returns:
             Aggregated NutritionData
         """
-        aggregated = NutritionData()
+        counts = Counter(normalize_query(ingredient.name) for ingredient in ingredients)
+        counts.pop("", None)
+        
+        totals = [0.0] * len(self.FREE_FIELDS)
+        
+        # Serve what we can from the per-ingredient cache
+        cached = await asyncio.gather(*(self._get_cached(name) for name in counts))
+        
+        # Group misses by how often they occur so each batch has a single weight
+        misses_by_count: Dict[int, List[str]] = {}
+        for (name, count), nutrition in zip(counts.items(), cached):
+            if nutrition is None:
+                misses_by_count.setdefault(count, []).append(name)
+            else:
+                totals = [total + count * value for total, value in zip(totals, self._get_free_fields(nutrition))]
+        
+        weighted_batches = [
+            (batch, count)
+            for count, names in misses_by_count.items()
+            for batch in self.build_batches(names)
+        ]
+        
+        # Bounds every API Ninjas request, including per-item fallbacks
+        sem = asyncio.Semaphore(self.MAX_CONCURRENCY)
+        
+        # One request per batch, all batches in flight at once
+        results = await asyncio.gather(
+            *(self._lookup_batch(batch, sem) for batch, _ in weighted_batches), return_exceptions=True
+        )
         
-        for ingredient in ingredients:
-            nutrition = self.get_nutrition(ingredient.name)
+        for (_, count), nutrition in zip(weighted_batches, results):
+            if isinstance(nutrition, BaseException):
+                continue
             
-            # Sum all fields
-            for field in self.FREE_FIELDS:
-                current = getattr(aggregated, field, 0)
-                ingredient_value = getattr(nutrition, field, 0)
-                setattr(aggregated, field, current + ingredient_value)
+            # Sum all fields (one C-level call fetches all nine values)
+            totals = [total + count * value for total, value in zip(totals, self._get_free_fields(nutrition))]
         
-        return aggregated
+        return NutritionData(**dict(zip(self.FREE_FIELDS, totals)))
@@ -1,6 +1,22 @@
-import os
-from typing import List, Dict, Any
+import asyncio
+import hashlib
+import logging
+import httpx
+from typing import List, Dict, Any, Optional, Tuple
+from cachetools import TTLCache
+from utils.cache import RedisCache
 from utils.http_client import HTTPClient
+from utils.settings import get_settings
+
+
+log = logging.getLogger(__name__)
+
+# Per-process cache of cleaned results, keyed by (normalized query, num_results)
+_search_cache: TTLCache = TTLCache(maxsize=10_000, ttl=3600)
+
+# One in-flight task per key; concurrent identical searches all await it,
+# so Serper is called once
+_inflight_searches: Dict[Tuple[str, int], "asyncio.Task[List[Dict[str, Any]]]"] = {}
 
 
 class SerperClient:
@@ -8,21 +24,27 @@ class SerperClient:
     
     BASE_URL = "https://google.serper.dev/search"
     
-    def __init__(self, api_key: str = None):
+    # Cache entry lifetime (seconds)
+    CACHE_TTL = 3600
+    
+    def __init__(self, api_key: str = None, http: Optional[httpx.AsyncClient] = None):
         """
         Initialize Serper client.
         
         Args:
-            api_key: Serper API key. If None, reads from SERPER_API_KEY env var.
+            api_key: Serper API key. If None, taken from Settings (SERPER_API_KEY).
+            http: Shared async HTTP client (defaults to HTTPClient's fallback client)
         """
-        self.api_key = api_key or os.getenv("SERPER_API_KEY")
-        if not self.api_key:
-            raise ValueError("SERPER_API_KEY not found in environment or arguments")
+        self.api_key = api_key or get_settings().serper_api_key
+        self.http = http
     
-    def search(self, query: str, num_results: int = 10) -> List[Dict[str, Any]]:
+    async def search(self, query: str, num_results: int = 10) -> List[Dict[str, Any]]:
         """
         Perform a web search using Serper API.
         
+        Results are cached for an hour per (query, num_results), in-process
+        and in Redis (when REDIS_URL is set). Failed searches are not cached.
+        
         Args:
             query: Search query string
             num_results: Number of results to return (default: 10)
@@ -30,6 +52,62 @@ class SerperClient:
         Returns:
             List of search results with 'title', 'link', 'snippet'
         """
+        key = (query.lower().strip(), num_results)
+        
+        cached = _search_cache.get(key)
+        if cached is not None:
+            return list(cached)
+        
+        task = _inflight_searches.get(key)
+        if task is None:
+            task = asyncio.create_task(self._search_uncached(key, query))
+            _inflight_searches[key] = task
+            task.add_done_callback(lambda done: _forget_search(key, done))
+        
+        # Shield so one caller disconnecting does not cancel the shared search
+        return list(await asyncio.shield(task))
+    
+    async def _search_uncached(self, key: Tuple[str, int], query: str) -> List[Dict[str, Any]]:
+        """
+        Look up Redis, then Serper, and fill both caches.
+        
+        Args:
+            key: (normalized query, num_results) cache key
+            query: Search query string as given
+            
+        Returns:
+            List of cleaned search results (empty on failure, which is not cached)
+        """
+        num_results = key[1]
+        digest = hashlib.sha1(key[0].encode("utf-8")).hexdigest()
+        cache_key = f"serper:v1:{digest}:{num_results}"
+        cleaned_results = await RedisCache.get_json(cache_key)
+        
+        if cleaned_results is None:
+            try:
+                cleaned_results = await self._fetch_results(query, num_results)
+            except Exception:
+                log.warning("serper search failed: %r", query, exc_info=True)
+                return []
+            await RedisCache.set_json(cache_key, cleaned_results, self.CACHE_TTL)
+        
+        _search_cache[key] = cleaned_results
+        return cleaned_results
+    
+    async def _fetch_results(self, query: str, num_results: int) -> List[Dict[str, Any]]:
+        """
+        Call Serper and keep only 'title', 'link', 'snippet' of organic results.
+        
+        Args:
+            query: Search query string
+            num_results: Number of results to return
+            
+        Returns:
+            List of cleaned search results
+            
+        Raises:
+            HTTPError if the request fails
+        """
         headers = {
             "X-API-KEY": self.api_key,
             "Content-Type": "application/json",
@@ -40,26 +118,20 @@ class SerperClient:
             "num": num_results,
         }
         
-        try:
-            response = HTTPClient.post(self.BASE_URL, payload, headers)
-            results = response.get("organic", [])
-            
-            # Extract relevant fields
-            cleaned_results = [
-                {
-                    "title": result.get("title", ""),
-                    "link": result.get("link", ""),
-                    "snippet": result.get("snippet", ""),
-                }
-                for result in results
-            ]
-            
-            return cleaned_results
-        except Exception as e:
-            print(f"Serper search failed: {e}")
-            return []
+        response = await HTTPClient.apost(self.BASE_URL, payload, headers, client=self.http)
+        results = response.get("organic", [])
+        
+        # Extract relevant fields
+        return [
+            {
+                "title": result.get("title", ""),
+                "link": result.get("link", ""),
+                "snippet": result.get("snippet", ""),
+            }
+            for result in results
+        ]
     
-    def get_top_urls(self, query: str, count: int = 4) -> List[str]:
+    async def get_top_urls(self, query: str, count: int = 4) -> List[str]:
         """
         Get top URLs from search results.
         
@@ -70,5 +142,11 @@ class SerperClient:
         Returns:
             List of URLs (max 'count' items)
         """
-        results = self.search(query, num_results=count)
+        results = await self.search(query, num_results=count)
         return [result["link"] for result in results if result.get("link")]
+
+
+def _forget_search(key: Tuple[str, int], task: "asyncio.Task[List[Dict[str, Any]]]") -> None:
+    """Drop a finished search from the in-flight map, unless a newer one replaced it."""
+    if _inflight_searches.get(key) is task:
+        del _inflight_searches[key]
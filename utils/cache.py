@@ -0,0 +1,86 @@
+import orjson
+import redis.asyncio as aioredis
+from typing import Any, Optional
+
+
+# Redis is an optional cache: give up fast and treat slowness as a miss
+REDIS_TIMEOUT = 0.2
+
+# Shared Redis connection, set up by configure() from Settings.redis_url
+_redis: Optional[aioredis.Redis] = None
+
+
+class RedisCache:
+    """Optional Redis-backed JSON cache shared across workers (enabled via configure())."""
+
+    @staticmethod
+    def configure(url: Optional[str]) -> None:
+        """
+        Set up the shared Redis client from an explicit URL.
+        
+        Args:
+            url: Redis URL; None or empty leaves the cache disabled
+        """
+        global _redis
+        if url and _redis is None:
+            _redis = aioredis.from_url(
+                url, socket_connect_timeout=REDIS_TIMEOUT, socket_timeout=REDIS_TIMEOUT
+            )
+
+    @staticmethod
+    def get_client() -> Optional[aioredis.Redis]:
+        """
+        Get the shared Redis client.
+        
+        Returns:
+            Redis client, or None if Redis has not been configured
+        """
+        return _redis
+
+    @staticmethod
+    async def get_json(key: str) -> Optional[Any]:
+        """
+        Read a JSON value from Redis.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Decoded value, or None on miss, error, or when Redis is disabled
+        """
+        client = RedisCache.get_client()
+        if client is None:
+            return None
+        
+        try:
+            raw = await client.get(key)
+            return orjson.loads(raw) if raw is not None else None
+        except Exception:
+            return None
+
+    @staticmethod
+    async def set_json(key: str, value: Any, ttl: int) -> None:
+        """
+        Store a JSON value in Redis with an expiry (errors are ignored).
+        
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+            ttl: Expiry in seconds
+        """
+        client = RedisCache.get_client()
+        if client is None:
+            return
+        
+        try:
+            await client.set(key, orjson.dumps(value), ex=ttl)
+        except Exception:
+            pass
+
+    @staticmethod
+    async def close() -> None:
+        """Close the shared Redis client (called on app shutdown)."""
+        global _redis
+        if _redis is not None:
+            await _redis.aclose()
+            _redis = None
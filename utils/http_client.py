@@ -1,43 +1,136 @@
+import httpx
 import requests
-from typing import Dict, Any, Optional
+from requests.adapters import HTTPAdapter
+from tenacity import AsyncRetrying, retry_if_exception, stop_after_attempt, wait_exponential_jitter
+from typing import Dict, Any, Optional, Tuple
+from urllib3.util import Retry
+
+
+# Status codes worth retrying (rate limits and transient upstream failures)
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def _build_session() -> requests.Session:
+    """Create a keep-alive session with a bounded connection pool and 1 retry with backoff."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=20,
+        pool_maxsize=100,
+        max_retries=Retry(
+            total=1,
+            backoff_factor=0.3,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=frozenset(["GET", "POST"]),
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _is_retriable(exc: BaseException) -> bool:
+    """Retry transport errors and RETRY_STATUSES responses; never other 4xx."""
+    if isinstance(exc, httpx.TransportError):
+        return True
+    return isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code in RETRY_STATUSES
+
+
+def _async_retrying() -> AsyncRetrying:
+    """Retry policy for the async path: initial attempt + 1 retry with jittered backoff."""
+    return AsyncRetrying(
+        stop=stop_after_attempt(2),
+        wait=wait_exponential_jitter(initial=0.3, max=2),
+        retry=retry_if_exception(_is_retriable),
+        reraise=True,
+    )
+
+
+def _status_code(exc: BaseException) -> Optional[int]:
+    """HTTP status of a failed response (requests or httpx), or None for transport errors."""
+    response = getattr(exc, "response", None)
+    return getattr(response, "status_code", None)
+
+
+# Shared sync session so repeated calls to the same host reuse sockets
+_session = _build_session()
+
+# Cap on HTML bytes read per page; JSON-LD lives near the top of recipe pages
+MAX_HTML_BYTES = 1_048_576
+
+# Fallback async client for calls made without an injected client
+_aclient: Optional[httpx.AsyncClient] = None
 
 
 class HTTPClient:
     """Generic HTTP client with automatic retry on failure."""
-
+    
+    @staticmethod
+    def create_async_client() -> httpx.AsyncClient:
+        """
+        Create a pooled HTTP/2 async client.
+        
+        The app creates one in its lifespan and injects it into every
+        client that makes async calls.
+        
+        Returns:
+            New httpx.AsyncClient (the caller closes it)
+        """
+        return httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=10.0,
+            http2=True,
+        )
+    
     @staticmethod
-    def get(url: str, headers: Optional[Dict[str, str]] = None, timeout: int = 10) -> Dict[str, Any]:
+    def open_async_client() -> httpx.AsyncClient:
         """
-        GET request with 1 automatic retry on failure.
+        Get the module-level fallback client used when no client is injected.
+        
+        Returns:
+            The shared httpx.AsyncClient
+        """
+        global _aclient
+        if _aclient is None:
+            _aclient = HTTPClient.create_async_client()
+        return _aclient
+    
+    @staticmethod
+    async def close_async_client() -> None:
+        """Close the fallback async client (called on app shutdown)."""
+        global _aclient
+        if _aclient is not None:
+            await _aclient.aclose()
+            _aclient = None
+    
+    @staticmethod
+    def get(url: str, headers: Optional[Dict[str, str]] = None, timeout: int = 10, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        GET request with 1 automatic retry on transient failure.
         
         Args:
             url: Target URL
             headers: Optional HTTP headers
             timeout: Request timeout in seconds
+            params: Optional query parameters (URL-encoded by the client)
             
         Returns:
             Response JSON as dictionary
             
         Raises:
-            HTTPError if both attempts fail
+            HTTPError if the request fails
         """
-        headers = headers or {}
-        
-        for attempt in range(2):  # Try twice: initial + 1 retry
-            try:
-                response = requests.get(url, headers=headers, timeout=timeout)
-                response.raise_for_status()
-                return response.json()
-            except Exception as e:
-                if attempt == 1:  # Last attempt failed
-                    raise HTTPError(f"GET {url} failed after retry: {str(e)}")
-                # First attempt failed, will retry
-                continue
+        try:
+            response = _session.get(url, params=params, headers=headers, timeout=timeout)
+            response.raise_for_status()
+            return response.json()
+        except Exception as e:
+            raise HTTPError(f"GET {url} failed: {str(e)}", status_code=_status_code(e))
     
     @staticmethod
     def post(url: str, data: Dict[str, Any], headers: Optional[Dict[str, str]] = None, timeout: int = 10) -> Dict[str, Any]:
         """
-        POST request with 1 automatic retry on failure.
+        POST request with 1 automatic retry on transient failure.
         
         Args:
             url: Target URL
@@ -49,26 +142,22 @@ class HTTPClient:
             Response JSON as dictionary
             
         Raises:
-            HTTPError if both attempts fail
+            HTTPError if the request fails
         """
         headers = headers or {}
         headers["Content-Type"] = "application/json"
         
-        for attempt in range(2):  # Try twice: initial + 1 retry
-            try:
-                response = requests.post(url, json=data, headers=headers, timeout=timeout)
-                response.raise_for_status()
-                return response.json()
-            except Exception as e:
-                if attempt == 1:  # Last attempt failed
-                    raise HTTPError(f"POST {url} failed after retry: {str(e)}")
-                # First attempt failed, will retry
-                continue
+        try:
+            response = _session.post(url, json=data, headers=headers, timeout=timeout)
+            response.raise_for_status()
+            return response.json()
+        except Exception as e:
+            raise HTTPError(f"POST {url} failed: {str(e)}", status_code=_status_code(e))
     
     @staticmethod
     def fetch_html(url: str, timeout: int = 10) -> str:
         """
-        Fetch raw HTML with 1 automatic retry on failure.
+        Fetch raw HTML with 1 automatic retry on transient failure.
         
         Args:
             url: Target URL
@@ -78,20 +167,141 @@ class HTTPClient:
             HTML content as string
             
         Raises:
-            HTTPError if both attempts fail
+            HTTPError if the request fails
+        """
+        try:
+            response = _session.get(url, timeout=timeout)
+            response.raise_for_status()
+            return response.text
+        except Exception as e:
+            raise HTTPError(f"Fetch HTML {url} failed: {str(e)}", status_code=_status_code(e))
+    
+    @staticmethod
+    async def aget(
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: int = 10,
+        params: Optional[Dict[str, Any]] = None,
+        client: Optional[httpx.AsyncClient] = None,
+    ) -> Dict[str, Any]:
+        """
+        Async GET request with 1 automatic retry on transient failure.
+        
+        Args:
+            url: Target URL
+            headers: Optional HTTP headers
+            timeout: Request timeout in seconds
+            params: Optional query parameters (URL-encoded by the client)
+            client: Injected async client (defaults to the fallback client)
+            
+        Returns:
+            Response JSON as dictionary
+            
+        Raises:
+            HTTPError if the request fails
+        """
+        client = client or HTTPClient.open_async_client()
+        
+        try:
+            async for attempt in _async_retrying():
+                with attempt:
+                    response = await client.get(url, params=params, headers=headers, timeout=timeout)
+                    response.raise_for_status()
+            return response.json()
+        except Exception as e:
+            raise HTTPError(f"GET {url} failed: {str(e)}", status_code=_status_code(e))
+    
+    @staticmethod
+    async def apost(
+        url: str,
+        data: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None,
+        timeout: int = 10,
+        client: Optional[httpx.AsyncClient] = None,
+    ) -> Dict[str, Any]:
+        """
+        Async POST request with 1 automatic retry on transient failure.
+        
+        Args:
+            url: Target URL
+            data: Request body as dictionary
+            headers: Optional HTTP headers
+            timeout: Request timeout in seconds
+            client: Injected async client (defaults to the fallback client)
+            
+        Returns:
+            Response JSON as dictionary
+            
+        Raises:
+            HTTPError if the request fails
         """
-        for attempt in range(2):  # Try twice: initial + 1 retry
-            try:
-                response = requests.get(url, timeout=timeout)
-                response.raise_for_status()
-                return response.text
-            except Exception as e:
-                if attempt == 1:  # Last attempt failed
-                    raise HTTPError(f"Fetch HTML {url} failed after retry: {str(e)}")
-                # First attempt failed, will retry
-                continue
+        client = client or HTTPClient.open_async_client()
+        headers = headers or {}
+        headers["Content-Type"] = "application/json"
+        
+        try:
+            async for attempt in _async_retrying():
+                with attempt:
+                    response = await client.post(url, json=data, headers=headers, timeout=timeout)
+                    response.raise_for_status()
+            return response.json()
+        except Exception as e:
+            raise HTTPError(f"POST {url} failed: {str(e)}", status_code=_status_code(e))
+    
+    @staticmethod
+    async def afetch_html(
+        url: str,
+        timeout: int = 10,
+        max_bytes: int = MAX_HTML_BYTES,
+        client: Optional[httpx.AsyncClient] = None,
+    ) -> Tuple[bytes, Optional[str]]:
+        """
+        Async fetch of raw HTML with 1 automatic retry on transient failure.
+        
+        The body is streamed and reading stops after max_bytes, so heavy
+        pages are not downloaded or parsed in full.
+        
+        Args:
+            url: Target URL
+            timeout: Request timeout in seconds
+            max_bytes: Maximum number of body bytes to read
+            client: Injected async client (defaults to the fallback client)
+            
+        Returns:
+            HTML content as bytes (possibly truncated), and the charset
+            from the Content-Type header (None if not given)
+            
+        Raises:
+            HTTPError if the request fails
+        """
+        client = client or HTTPClient.open_async_client()
+        
+        try:
+            async for attempt in _async_retrying():
+                with attempt:
+                    async with client.stream("GET", url, timeout=timeout, follow_redirects=True) as response:
+                        response.raise_for_status()
+                        encoding = response.charset_encoding
+                        chunks = []
+                        total = 0
+                        async for chunk in response.aiter_bytes(65536):
+                            chunks.append(chunk)
+                            total += len(chunk)
+                            if total >= max_bytes:
+                                break
+            return b"".join(chunks), encoding
+        except Exception as e:
+            raise HTTPError(f"Fetch HTML {url} failed: {str(e)}", status_code=_status_code(e))
 
 
 class HTTPError(Exception):
     """Custom HTTP error."""
-    pass
+    
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        """
+        Args:
+            message: Error description
+            status_code: Upstream HTTP status, if the failure was an error response
+        """
+        super().__init__(message)
+        self.status_code = status_code
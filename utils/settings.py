@@ -0,0 +1,28 @@
+from functools import lru_cache
+from typing import Optional
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class Settings(BaseSettings):
+    """Application settings, read from the environment and .env."""
+    
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
+    
+    serper_api_key: str = Field(min_length=1)
+    ninja_api_key: str = Field(min_length=1)
+    redis_url: Optional[str] = None
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """
+    Load and validate settings once per process.
+    
+    Returns:
+        Cached Settings instance
+        
+    Raises:
+        pydantic.ValidationError if a required key is missing
+    """
+    return Settings()